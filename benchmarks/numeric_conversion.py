@@ -0,0 +1,103 @@
+"""Benchmark NUMERIC/DECIMAL conversion from fetched buffer to JSON line.
+
+Compares the per-cell work of the two sync paths for rows made of
+NUMERIC(18,4) columns plus an INTEGER id:
+
+  decimal  - the column is selected as-is; fdb builds a Decimal from the
+             INT64 buffer and divides it by 10**scale, and the record is
+             dumped with use_decimal=True.
+  rawjson  - the column is selected as CAST(... AS VARCHAR(40)); fdb hands
+             back the server's text (bytes without a connection charset),
+             which row_to_record wraps in simplejson.RawJSON.
+
+Both paths use fdb's own decoding helpers and tap_firebird.row_to_record,
+so only the server side of the fetch is left out.
+
+Usage: python benchmarks/numeric_conversion.py [rows] [numeric_columns]
+"""
+import decimal
+import os
+import sys
+import timeit
+
+import simplejson as json
+from fdb.fbcore import _tenTo, b2u, bytes_to_int
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import tap_firebird  # noqa: E402
+from singer.catalog import CatalogEntry  # noqa: E402
+from singer.schema import Schema  # noqa: E402
+
+SCALE = 4
+
+
+def make_entry(column_type, width):
+    cols = [{'name': 'AMOUNT_{}'.format(n), 'type': column_type,
+             'scale': SCALE, 'nullable': 1} for n in range(width)]
+    cols.append({'name': 'ID', 'type': 'INTEGER', 'scale': 0, 'nullable': 1})
+    return CatalogEntry(
+        stream='BENCH',
+        schema=Schema(type='object', properties={
+            c['name']: tap_firebird.schema_for_column(c) for c in cols}))
+
+
+def make_buffers(rows):
+    """Raw scaled INT64 buffers and the matching server VARCHAR text."""
+    raws = [123456789012345 * (i % 7 - 3) + i for i in range(rows)]
+    int64 = [r.to_bytes(8, sys.byteorder, signed=True) for r in raws]
+    text = [str(decimal.Decimal(r).scaleb(-SCALE)).encode('ascii')
+            for r in raws]
+    return int64, text
+
+
+def decimal_path(entry, buffers, width):
+    columns = list(entry.schema.properties)
+    out = []
+    for i, buf in enumerate(buffers):
+        row = tuple(decimal.Decimal(bytes_to_int(buf)) / _tenTo[SCALE]
+                    for _ in range(width)) + (i,)
+        message = tap_firebird.row_to_record(
+            entry, 1, row, columns, None)
+        out.append(json.dumps(message.asdict(), use_decimal=True))
+    return out
+
+
+def rawjson_path(entry, buffers, width):
+    columns = list(entry.schema.properties)
+    numeric_indexes = set(range(width))
+    out = []
+    for i, buf in enumerate(buffers):
+        row = tuple(b2u(bytes(buf), None) for _ in range(width)) + (i,)
+        message = tap_firebird.row_to_record(
+            entry, 1, row, columns, None, numeric_indexes)
+        out.append(json.dumps(message.asdict(), use_decimal=True))
+    return out
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    int64, text = make_buffers(rows)
+    old_entry = make_entry('INT64', width)
+    new_entry = make_entry('NUMERIC', width)
+
+    old = decimal_path(old_entry, int64, width)
+    new = rawjson_path(new_entry, text, width)
+    for a, b in zip(old, new):
+        assert (json.loads(a, use_decimal=True)
+                == json.loads(b, use_decimal=True)), (a, b)
+
+    print('simplejson {}, {} rows x {} numeric columns, best of 5'.format(
+        json.__version__, rows, width))
+    for name, func, entry, buffers in (
+            ('decimal', decimal_path, old_entry, int64),
+            ('rawjson', rawjson_path, new_entry, text)):
+        best = min(timeit.repeat(lambda: func(entry, buffers, width),
+                                 number=1, repeat=5))
+        print('{:8} {:.4f}s  {:.2f}us/row'.format(
+            name, best, best / rows * 1e6))
+
+
+if __name__ == '__main__':
+    main()
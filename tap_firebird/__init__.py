@@ -39,6 +39,8 @@ BYTES_FOR_INTEGER_TYPE = {
 
 FLOAT_TYPES = {'float', 'float4', 'float8', 'double', 'd_float'}
 
+NUMERIC_TYPES = {'numeric', 'decimal'}
+
 DATE_TYPES = {'date'}
 
 DATETIME_TYPES = {'timestamp', 'timestamptz',
@@ -66,7 +68,13 @@ def discover_catalog(conn):
         conn,
         """
         select rf.RDB$RELATION_NAME AS table_name, rf.RDB$FIELD_POSITION AS ordinal_position, rf.RDB$FIELD_NAME AS column_name,
-        CASE F.RDB$FIELD_TYPE
+        CASE
+         WHEN F.RDB$FIELD_TYPE IN (7, 8, 16) AND F.RDB$FIELD_SCALE < 0
+          AND F.RDB$FIELD_SUB_TYPE = 2
+          THEN 'DECIMAL'
+         WHEN F.RDB$FIELD_TYPE IN (7, 8, 16) AND F.RDB$FIELD_SCALE < 0
+          THEN 'NUMERIC'
+         ELSE CASE F.RDB$FIELD_TYPE
             WHEN 7 THEN 'SMALLINT'
             WHEN 8 THEN 'INTEGER'
             WHEN 9 THEN 'QUAD'
@@ -83,8 +91,10 @@ def discover_catalog(conn):
             WHEN 40 THEN 'CSTRING'
             WHEN 261 THEN 'BLOB'
             ELSE 'UNKNOWN'
+         END
         END AS udt_name,
-        rf.RDB$NULL_FLAG AS is_nullable
+        rf.RDB$NULL_FLAG AS is_nullable,
+        0 - COALESCE(f.RDB$FIELD_SCALE, 0) AS numeric_scale
         from rdb$relation_fields rf
         INNER JOIN RDB$RELATIONS r ON r.RDB$RELATION_NAME = rf.rdb$relation_name
         INNER JOIN RDB$FIELDS f ON rf.RDB$FIELD_SOURCE = f.RDB$FIELD_NAME
@@ -114,7 +124,7 @@ def discover_catalog(conn):
     entries = []
     table_columns = [{'name': k, 'columns': [
         {'pos': t[1], 'name': t[2].strip(), 'type': t[3].strip(),
-         'nullable': t[4]} for t in v]}
+         'nullable': t[4], 'scale': t[5]} for t in v]}
                      for k, v in groupby(column_specs, key=lambda t: t[0].strip())]
 
     table_pks = {k.strip(): [t[1].strip() for t in v]
@@ -176,8 +186,9 @@ def schema_for_column(c):
     elif column_type in FLOAT_TYPES:
         result.type = 'number'
 
-    elif column_type == 'numeric':
+    elif column_type in NUMERIC_TYPES:
         result.type = 'number'
+        result.multipleOf = 10 ** (0 - c['scale'])
 
     elif column_type in STRING_TYPES:
         result.type = 'string'
@@ -278,11 +289,19 @@ def get_stream_version(tap_stream_id, state):
                                "version") or int(time.time() * 1000)
 
 
-def row_to_record(catalog_entry, version, row, columns, time_extracted):
+def row_to_record(catalog_entry, version, row, columns, time_extracted,
+                  numeric_indexes=()):
     row_to_persist = ()
 
     for idx, elem in enumerate(row):
-        if isinstance(elem, datetime.datetime):
+        if idx in numeric_indexes:
+            # Exact decimal text selected by the server, written as-is.
+            # Without a connection charset fdb returns VARCHAR as bytes.
+            if isinstance(elem, bytes):
+                elem = elem.decode('ascii')
+            if elem is not None:
+                elem = json.RawJSON(elem)
+        elif isinstance(elem, datetime.datetime):
             # elem = elem.isoformat('T') + 'Z'
             elem = elem.isoformat('T')
         elif isinstance(elem, datetime.date):
@@ -312,8 +331,16 @@ def sync_table(connection, catalog_entry, state):
 
     cursor = connection.cursor()
     table = catalog_entry.table
+    # Scaled NUMERIC/DECIMAL columns are cast to text by the server so
+    # they can be emitted exactly without a Decimal per cell
+    numeric_indexes = {
+        idx for idx, c in enumerate(columns)
+        if catalog_entry.schema.properties[c].multipleOf is not None}
     select = 'SELECT {} FROM {}'.format(
-        ','.join('"{}"'.format(c) for c in columns),
+        ','.join(
+            'CAST("{0}" AS VARCHAR(40)) AS "{0}"'.format(c)
+            if idx in numeric_indexes else '"{}"'.format(c)
+            for idx, c in enumerate(columns)),
         '"{}"'.format(table))
 
     if start_date is not None:
@@ -353,6 +380,10 @@ def sync_table(connection, catalog_entry, state):
             'replication_key_value'
         ) or str(formatted_start_date)
 
+    # Scaled columns are aliased to their own name in the select list, so
+    # the sort key is qualified to order by the column rather than its text
+    order_by = '"{}"."{}"'.format(table, replication_key)
+
     if replication_key_value is not None:
         try:
             replication_key_value = datetime.datetime.strptime(replication_key_value, '%Y-%m-%dT%H:%M:%S.%f')\
@@ -361,10 +392,10 @@ def sync_table(connection, catalog_entry, state):
             pass
 
         select += ' WHERE {} >= \'{}\' ORDER BY {} ' \
-                  'ASC'.format(replication_key, replication_key_value, replication_key)
+                  'ASC'.format(replication_key, replication_key_value, order_by)
 
     elif replication_key is not None:
-        select += ' ORDER BY {} ASC'.format(replication_key)
+        select += ' ORDER BY {} ASC'.format(order_by)
 
     time_extracted = utils.now()
     LOGGER.info('Running {}'.format(select))
@@ -382,15 +413,20 @@ def sync_table(connection, catalog_entry, state):
                                            stream_version,
                                            row,
                                            columns,
-                                           time_extracted)
+                                           time_extracted,
+                                           numeric_indexes)
             yield record_message
 
             if replication_key is not None:
+                replication_key_value = record_message.record[
+                    replication_key]
+                # Keep exact numeric text in state rather than RawJSON
+                if isinstance(replication_key_value, json.RawJSON):
+                    replication_key_value = replication_key_value.encoded_json
                 state = singer.write_bookmark(state,
                                               tap_stream_id,
                                               'replication_key_value',
-                                              record_message.record[
-                                                  replication_key])
+                                              replication_key_value)
             if rows_saved % 1000 == 0:
                 yield singer.StateMessage(value=copy.deepcopy(state))
             row = cursor.fetchone()
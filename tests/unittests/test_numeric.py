@@ -0,0 +1,140 @@
+import json as stdlib_json
+import unittest
+
+import simplejson as json
+from singer.catalog import CatalogEntry
+from singer.schema import Schema
+
+import tap_firebird
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    def execute(self, query):
+        self.queries.append(query)
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.cur = FakeCursor(rows)
+
+    def cursor(self):
+        return self.cur
+
+
+def make_entry(cols, replication_key=None):
+    mdata = []
+    if replication_key:
+        mdata = [{'breadcrumb': [],
+                  'metadata': {'replication-key': replication_key}}]
+    return CatalogEntry(
+        tap_stream_id='ORDERS',
+        stream='ORDERS',
+        table='ORDERS',
+        database='test.fdb',
+        metadata=mdata,
+        schema=Schema(type='object', properties={
+            c['name']: tap_firebird.schema_for_column(c) for c in cols}))
+
+
+class TestSchemaForColumn(unittest.TestCase):
+
+    def test_numeric_with_scale(self):
+        schema = tap_firebird.schema_for_column(
+            {'type': 'NUMERIC', 'scale': 4, 'nullable': 0})
+        self.assertEqual(schema.type, ['null', 'number'])
+        self.assertEqual(schema.multipleOf, 0.0001)
+
+    def test_decimal_with_scale(self):
+        schema = tap_firebird.schema_for_column(
+            {'type': 'DECIMAL', 'scale': 2, 'nullable': 1})
+        self.assertEqual(schema.type, 'number')
+        self.assertEqual(schema.multipleOf, 0.01)
+
+    def test_int64_stays_integer(self):
+        schema = tap_firebird.schema_for_column(
+            {'type': 'INT64', 'scale': 0, 'nullable': 1})
+        self.assertEqual(schema.type, 'integer')
+        self.assertEqual(schema.minimum, -2 ** 63)
+        self.assertEqual(schema.maximum, 2 ** 63 - 1)
+        self.assertIsNone(schema.multipleOf)
+
+
+class TestRowToRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.entry = make_entry([
+            {'name': 'AMOUNT', 'type': 'NUMERIC', 'scale': 4, 'nullable': 0},
+            {'name': 'ID', 'type': 'INTEGER', 'scale': 0, 'nullable': 1}])
+
+    def dump(self, row):
+        message = tap_firebird.row_to_record(
+            self.entry, 1, row, ['AMOUNT', 'ID'], None, {0})
+        return json.dumps(message.asdict(), use_decimal=True)
+
+    def test_str_value(self):
+        self.assertIn('"AMOUNT": 123.4500', self.dump(('123.4500', 1)))
+
+    def test_bytes_value(self):
+        self.assertIn('"AMOUNT": -0.5000', self.dump((b'-0.5000', 1)))
+
+    def test_null_value(self):
+        message = tap_firebird.row_to_record(
+            self.entry, 1, (None, 1), ['AMOUNT', 'ID'], None, {0})
+        self.assertIsNone(message.record['AMOUNT'])
+        self.assertIn('"AMOUNT": null', self.dump((None, 1)))
+
+
+class TestSyncTable(unittest.TestCase):
+
+    def test_select_casts_only_numeric_columns(self):
+        entry = make_entry([
+            {'name': 'AMOUNT', 'type': 'NUMERIC', 'scale': 2, 'nullable': 0},
+            {'name': 'ID', 'type': 'INTEGER', 'scale': 0, 'nullable': 1},
+            {'name': 'PRICE', 'type': 'DOUBLE', 'scale': 0, 'nullable': 0}])
+        conn = FakeConnection([(b'1.50', 7, 2.5)])
+
+        messages = list(tap_firebird.sync_table(conn, entry, {}))
+
+        self.assertEqual(
+            conn.cur.queries,
+            ['SELECT CAST("AMOUNT" AS VARCHAR(40)) AS "AMOUNT",'
+             '"ID","PRICE" FROM "ORDERS"'])
+        records = [m for m in messages
+                   if isinstance(m, tap_firebird.singer.RecordMessage)]
+        self.assertEqual(len(records), 1)
+        self.assertIn('"AMOUNT": 1.50, "ID": 7, "PRICE": 2.5',
+                      json.dumps(records[0].asdict(), use_decimal=True))
+
+    def test_incremental_on_numeric_key(self):
+        entry = make_entry([
+            {'name': 'AMOUNT', 'type': 'NUMERIC', 'scale': 2, 'nullable': 0},
+            {'name': 'ID', 'type': 'INTEGER', 'scale': 0, 'nullable': 1}],
+            replication_key='AMOUNT')
+        state = {'bookmarks': {'ORDERS': {'replication_key_value': '9.50'}}}
+        conn = FakeConnection([(b'9.50', 1), (b'10.50', 2)])
+
+        messages = list(tap_firebird.sync_table(conn, entry, state))
+
+        self.assertEqual(
+            conn.cur.queries,
+            ['SELECT CAST("AMOUNT" AS VARCHAR(40)) AS "AMOUNT","ID" '
+             'FROM "ORDERS" WHERE AMOUNT >= \'9.50\' '
+             'ORDER BY "ORDERS"."AMOUNT" ASC'])
+        state_message = [m for m in messages
+                         if isinstance(m, tap_firebird.singer.StateMessage)
+                         ][-1]
+        bookmark = state_message.value['bookmarks']['ORDERS']
+        self.assertEqual(bookmark['replication_key_value'], '10.50')
+        self.assertIn('"replication_key_value": "10.50"',
+                      stdlib_json.dumps(state_message.value))
+
+
+if __name__ == '__main__':
+    unittest.main()